@@ -1,9 +1,8 @@
+from collections import defaultdict
 from random import random
 
 # f = open('dict.txt', 'r')
 f = open('scrabble_dict.txt', 'r')
-alphabet = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm',\
-            'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z']
 d = set()
 
 length_two_words = []
@@ -16,26 +15,43 @@ for l in f:
     if len(word) == 2:
         length_two_words.append(word)
 
-# Returns a 'chain': list of words which is longest path from root
-def longest_chain_from_root(root):
-    if root not in d:
-        return []
-    longest_chain = []
-    for letter in alphabet:
-        for extension in [letter + root, root + letter]:
-            chain = longest_chain_from_root(extension)
-            if len(chain) > len(longest_chain) or \
-                    (len(chain) == len(longest_chain) and random() > 0.5):
-                longest_chain = chain
-    return [root] + longest_chain
+# Maps each word to the dictionary words reachable from it by adding one
+# letter at the front or the back
+extensions = defaultdict(list)
+for w in d:
+    extensions[w[1:]].append(w)
+    extensions[w[:-1]].append(w)
+
+# Length of the longest chain starting at each word, plus the extension that
+# achieves it. Built longest-word-first, so every extension of a word has
+# already been scored by the time the word itself is scored.
+chain_len = {}
+next_word = {}
+for root in sorted(d, key=len, reverse=True):
+    best_len = 0
+    best_next = None
+    for extension in extensions.get(root, []):
+        if chain_len[extension] > best_len or \
+                (chain_len[extension] == best_len and random() > 0.5):
+            best_len = chain_len[extension]
+            best_next = extension
+    chain_len[root] = best_len + 1
+    next_word[root] = best_next
 
 # print len(d)
 # print len(length_two_words)
-best_chain = []
+best_root = None
 for starter in length_two_words:
-    chain = longest_chain_from_root(starter)
-    if len(chain) > len(best_chain) or (len(chain) == len(best_chain) and random() > 0.5):
-        best_chain = chain
+    if starter in chain_len and \
+            (best_root is None or chain_len[starter] > chain_len[best_root] or
+             (chain_len[starter] == chain_len[best_root] and random() > 0.5)):
+        best_root = starter
+
+best_chain = []
+word = best_root
+while word is not None:
+    best_chain.append(word)
+    word = next_word[word]
 
 for word in best_chain:
     print word
\ No newline at end of file
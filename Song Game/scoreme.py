@@ -20,12 +20,34 @@ if j != num_songs or len(sol_dict) != len(guess_dict):
     print('Wrong number of songs!')
     exit()
 
-kd_distance = 0
+# Counts inversions while merge-sorting; returns (sorted list, count)
+def merge_count(lst):
+    if len(lst) < 2:
+        return lst, 0
+    mid = len(lst) // 2
+    left, count = merge_count(lst[:mid])
+    right, right_count = merge_count(lst[mid:])
+    count += right_count
+    merged = []
+    i = 0
+    j = 0
+    while i < len(left) and j < len(right):
+        if left[i] <= right[j]:
+            merged.append(left[i])
+            i += 1
+        else:
+            # right[j] is out of order with everything left in `left`
+            count += len(left) - i
+            merged.append(right[j])
+            j += 1
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+    return merged, count
 
-for song1 in range(1, num_songs + 1):
-    for song2 in range(song1 + 1, num_songs + 1):
-        if (sol_dict[song1] < sol_dict[song2]) != \
-            (guess_dict[song1] < guess_dict[song2]):
-            kd_distance += 1
+# The Kendall tau distance is the number of inversions in the guess's
+# ordering of the songs when they are listed in solution order
+sol_order = sorted(sol_dict, key=lambda song: sol_dict[song])
+perm = [guess_dict[song] for song in sol_order]
+_, kd_distance = merge_count(perm)
 
 print('Your score is: %d. (Lower is better, 0 is perfect)' % kd_distance)
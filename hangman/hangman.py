@@ -9,17 +9,17 @@ def run_fair(words = None):
 		for word in f:
 			words.add(word.upper()[:-2])
 		return words
-	# Returns a set containing a random word
+	# Returns a list containing a random word
 	def selector(words):
-		word = random.sample(words, 1)[0]
-		return len(word), set([word])
+		word = random.choice(list(words))
+		return len(word), [word]
 	# PLays fairly
 	def updater(word_set, status, wrong_guesses, guess):
 		# Checks if guess is in word, updates status/wrong_guesses
 		correct = False
-		for i, char in enumerate(random.sample(word_set, 1)[0]):
+		for i, char in enumerate(word_set[0]):
 			if char == guess:
-				status[i] = char
+				status[i] = ord(char)
 				correct = True
 		if not correct:
 			wrong_guesses.append(guess)
@@ -41,21 +41,23 @@ def run_greedy(words = None):
 	def selector(words):
 		# Returns the most common length for set of words
 		def most_common_length(words):
-			return Counter(map(len, words)).most_common()[0][0]
+			lengths = Counter(map(len, words))
+			return max(lengths, key=lengths.get)
 		length = most_common_length(words)
 		return length, filter(lambda x: len(x)==length, words)
 	# Acts to restrict the set of words the least (greedily)
 	def updater(word_set, status, wrong_guesses, guess):
-		# Returns a sketch of where letter appears in word
-		def blank_all_but_guess(word):
-			return ''.join(map(lambda x: guess if x==guess else '_', word))
+		# Table mapping every character except the guess to '_', so sketching
+		# a word is a single C-level translate call
+		sketch_table = '_' * ord(guess) + guess + '_' * (255 - ord(guess))
 		# Returns the most common sketch
-		most_words = Counter(map(blank_all_but_guess, word_set)).most_common()[0][0]
+		sketch_counts = Counter(word.translate(sketch_table) for word in word_set)
+		most_words = max(sketch_counts, key=sketch_counts.get)
 		# Checks if guess is in sketch, updates status/wrong_guesses
 		correct = False
 		for i, char in enumerate(most_words):
 			if char != '_':
-				status[i] = char
+				status[i] = ord(char)
 				correct = True
 		if not correct:
 			wrong_guesses.append(guess)
@@ -92,15 +94,15 @@ updater:
 def runner(words, selector, updater):
 	# The number of unguessed letters in a status
 	def unguessed(status):
-		return len(filter(lambda x: x=='_', status))
+		return status.count('_')
 	wrong_guesses = []
 	length, word_set = selector(words)
-	status = ['_' for i in range(length)]
+	status = bytearray('_' * length)
 	while(unguessed(status) != 0):
 		# print len(word_set)
 		_ = os.system('clear')
 		print 'Wrong Guesses: '+', '.join(wrong_guesses)
-		print 'Word: '+' '.join(status)
+		print 'Word: '+' '.join(chr(c) for c in status)
 		guess = raw_input('Guess a letter: ').upper()
 		while len(guess) > 1 or not guess.isalpha() or guess in wrong_guesses or guess in status:
 			print('A guess must be a single letter that you have not already guessed.')
@@ -108,7 +110,7 @@ def runner(words, selector, updater):
 		word_set, status, wrong_guesses = updater(word_set, status, wrong_guesses, guess)
 	_ = os.system('clear')
 	print 'Wrong Guesses: '+', '.join(wrong_guesses)
-	print 'Word: '+' '.join(status)
+	print 'Word: '+' '.join(chr(c) for c in status)
 	print 'You win! Your score is %d (lower score is better).' % len(wrong_guesses)
 
 if len(sys.argv) == 2: